@@ -6,7 +6,9 @@ import base64
 # pylint: disable=too-few-public-methods, too-many-lines, too-many-branches
 import json
 import os
+from abc import ABCMeta
 from collections import namedtuple
+from functools import lru_cache
 from typing import Iterator, List, Optional, Tuple
 
 import numpy as np
@@ -167,6 +169,171 @@ pred = Pred("prediction", "rawPrediction", "probability", "predContrib")
 _INIT_BOOSTER_SAVE_PATH = "init_booster.json"
 
 
+@lru_cache(maxsize=None)
+def _xgb_params_default(xgb_cls):
+    """Default values of the supported `xgb_cls` constructor params, cached per
+    xgboost sklearn class."""
+    params_dict = xgb_cls().get_params()
+    filtered_params_dict = {
+        k: params_dict[k] for k in params_dict if k not in _unsupported_xgb_params
+    }
+    filtered_params_dict["n_estimators"] = DEFAULT_N_ESTIMATORS
+    return filtered_params_dict
+
+
+@lru_cache(maxsize=None)
+def _fit_params_default(xgb_cls):
+    """Default values of the supported `xgb_cls.fit` params, cached per xgboost
+    sklearn class."""
+    return _get_default_params_from_func(xgb_cls.fit, _unsupported_fit_params)
+
+
+@lru_cache(maxsize=None)
+def _predict_params_default(xgb_cls):
+    """Default values of the supported `xgb_cls.predict` params, cached per xgboost
+    sklearn class."""
+    return _get_default_params_from_func(xgb_cls.predict, _unsupported_predict_params)
+
+
+# Types of param values that never need conversion.
+_PLAIN_TYPES = frozenset((int, float, str, bool, type(None)))
+
+# Shared parent of the xgboost params set as class attributes, the params are copied
+# with the right parent when an estimator or model is instantiated.
+_DUMMY_PARENT = Params._dummy()
+
+_CALLBACKS_PARAM_DOC = (
+    "The callbacks can be arbitrary functions. It is saved using cloudpickle "
+    "which is not a fully self-contained format. It may fail to load with "
+    "different versions of dependencies."
+)
+
+
+def _spark_param_value_converter(v):
+    """Type converter of the xgboost params, it converts numpy scalar values, including
+    the ones nested in dict and list values, to the corresponding python scalar values.
+    """
+    if type(v) in _PLAIN_TYPES:
+        return v
+    if isinstance(v, np.generic):
+        return v.item()
+    if not isinstance(v, (dict, list)):
+        return v
+
+    # Walk nested containers with an explicit stack instead of recursion, each item
+    # is (output container, key or index, input value). Containers already seen are
+    # mapped by id to their converted copy, which is reused so that self-referencing
+    # values terminate and keep their structure.
+    root = [None]
+    stack = [(root, 0, v)]
+    converted = {}
+    while stack:
+        container, key, value = stack.pop()
+        if type(value) in _PLAIN_TYPES:
+            container[key] = value
+        elif isinstance(value, np.generic):
+            container[key] = value.item()
+        elif id(value) in converted:
+            container[key] = converted[id(value)]
+        elif isinstance(value, dict):
+            converted_dict = dict.fromkeys(value)
+            converted[id(value)] = converted_dict
+            container[key] = converted_dict
+            stack.extend((converted_dict, k, nv) for k, nv in value.items())
+        elif isinstance(value, list):
+            converted_list = [None] * len(value)
+            converted[id(value)] = converted_list
+            container[key] = converted_list
+            stack.extend((converted_list, i, nv) for i, nv in enumerate(value))
+        else:
+            container[key] = value
+    return root[0]
+
+
+@lru_cache(maxsize=None)
+def _xgb_param_doc_prefix(xgb_cls, method):
+    """Doc prefix shared by all the xgboost params of `xgb_cls`.`method`."""
+    return f"Refer to XGBoost doc of {get_class_name(xgb_cls)}{method} for this param "
+
+
+@lru_cache(maxsize=None)
+def _create_xgb_param(xgb_cls, name, method):
+    """Create the `Param` of the xgboost param `name` of `xgb_cls`, `method` is one of
+    "", ".fit()" or ".predict()". The estimator and the model of the same xgboost class
+    share the returned object."""
+    doc = _xgb_param_doc_prefix(xgb_cls, method) + name
+    if name == "callbacks":
+        doc += _CALLBACKS_PARAM_DOC
+    return Param(
+        _DUMMY_PARENT, name=name, doc=doc, typeConverter=_spark_param_value_converter
+    )
+
+
+class _SparkXGBParamsMeta(ABCMeta):
+    """Metaclass of the pyspark xgboost estimators and models.
+
+    The xgboost params of a class are only recorded by name in `_xgb_param_names`,
+    `_xgb_fit_param_names` and `_xgb_predict_param_names`, the `Param` class attribute
+    of each of them is created the first time it is looked up. Listing the class
+    attributes, which pyspark does when an estimator or model is instantiated, installs
+    all of them.
+    """
+
+    def __getattr__(cls, name):
+        # Only called when the regular attribute lookup fails.
+        param = None if name.startswith("_") else cls._lookup_xgb_param(name)
+        if param is None:
+            raise AttributeError(
+                f"type object '{cls.__name__}' has no attribute '{name}'"
+            )
+        type.__setattr__(cls, name, param)
+        return param
+
+    def __dir__(cls):
+        cls._install_xgb_param_names()
+        pending = [
+            (name, cls._lookup_xgb_param(name))
+            for name in (
+                cls._xgb_param_names
+                | cls._xgb_fit_param_names
+                | cls._xgb_predict_param_names
+            )
+            if name not in cls.__dict__
+        ]
+        for name, param in pending:
+            type.__setattr__(cls, name, param)
+        return super().__dir__()
+
+    def _install_xgb_param_names(cls):
+        # The xgboost param names are inferred once per class, when the first param
+        # is needed, which is at the latest when the class is instantiated.
+        if not cls._params_installed and cls._xgb_cls_ is not None:
+            _set_pyspark_xgb_cls_param_attrs(cls)
+
+    def _lookup_xgb_param(cls, name):
+        cls._install_xgb_param_names()
+        # Constructor params come first, some of them are accepted by fit() as well.
+        for names, method in (
+            (cls._xgb_param_names, ""),
+            (cls._xgb_fit_param_names, ".fit()"),
+            (cls._xgb_predict_param_names, ".predict()"),
+        ):
+            if name in names:
+                return _create_xgb_param(cls._xgb_cls_, name, method)
+        return None
+
+
+def _set_pyspark_xgb_cls_param_attrs(cls):
+    """This function automatically infer to xgboost parameters and record them
+    into the pyspark estimator or model `cls`, the `Param` attributes are created
+    on first access."""
+    xgb_cls = cls._xgb_cls_
+    cls._xgb_param_names = frozenset(_xgb_params_default(xgb_cls))
+    cls._xgb_fit_param_names = frozenset(_fit_params_default(xgb_cls))
+    cls._xgb_predict_param_names = frozenset(_predict_params_default(xgb_cls))
+    cls._params_installed = True
+
+
 class _SparkXGBParams(
     HasFeaturesCol,
     HasLabelCol,
@@ -179,7 +346,18 @@ class _SparkXGBParams(
     HasEnableSparseDataOptim,
     HasQueryIdCol,
     HasContribPredictionCol,
+    metaclass=_SparkXGBParamsMeta,
 ):
+    # Names of the xgboost params, set by `_set_pyspark_xgb_cls_param_attrs`.
+    _xgb_param_names = frozenset()
+    _xgb_fit_param_names = frozenset()
+    _xgb_predict_param_names = frozenset()
+
+    # The xgboost.XGBModel subclass, subclasses should set it.
+    _xgb_cls_ = None
+    # Whether `_set_pyspark_xgb_cls_param_attrs` has been called for the class.
+    _params_installed = False
+
     num_workers = Param(
         Params._dummy(),
         "num_workers",
@@ -210,24 +388,23 @@ class _SparkXGBParams(
         Params._dummy(), "feature_names", "A list of str to specify feature names."
     )
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._params_installed = False
+
     @classmethod
     def _xgb_cls(cls):
         """
-        Subclasses should override this method and
-        returns an xgboost.XGBModel subclass
+        Returns the xgboost.XGBModel subclass set by subclasses in `_xgb_cls_`, kept
+        for compatibility, internal code reads `_xgb_cls_` directly.
         """
-        raise NotImplementedError()
+        return cls._xgb_cls_
 
     # Parameters for xgboost.XGBModel()
     @classmethod
     def _get_xgb_params_default(cls):
-        xgb_model_default = cls._xgb_cls()()
-        params_dict = xgb_model_default.get_params()
-        filtered_params_dict = {
-            k: params_dict[k] for k in params_dict if k not in _unsupported_xgb_params
-        }
-        filtered_params_dict["n_estimators"] = DEFAULT_N_ESTIMATORS
-        return filtered_params_dict
+        # Return a copy so that callers can't mutate the cached defaults.
+        return dict(_xgb_params_default(cls._xgb_cls_))
 
     def _set_xgb_params_default(self):
         filtered_params_dict = self._get_xgb_params_default()
@@ -255,10 +432,7 @@ class _SparkXGBParams(
     # Parameters for xgboost.XGBModel().fit()
     @classmethod
     def _get_fit_params_default(cls):
-        fit_params = _get_default_params_from_func(
-            cls._xgb_cls().fit, _unsupported_fit_params
-        )
-        return fit_params
+        return dict(_fit_params_default(cls._xgb_cls_))
 
     def _set_fit_params_default(self):
         filtered_params_dict = self._get_fit_params_default()
@@ -278,10 +452,7 @@ class _SparkXGBParams(
     # Parameters for xgboost.XGBModel().predict()
     @classmethod
     def _get_predict_params_default(cls):
-        predict_params = _get_default_params_from_func(
-            cls._xgb_cls().predict, _unsupported_predict_params
-        )
-        return predict_params
+        return dict(_predict_params_default(cls._xgb_cls_))
 
     def _set_predict_params_default(self):
         filtered_params_dict = self._get_predict_params_default()
@@ -519,6 +690,9 @@ FeatureProp = namedtuple(
 
 
 class _SparkXGBEstimator(Estimator, _SparkXGBParams, MLReadable, MLWritable):
+    # The _SparkXGBModel subclass, subclasses should set it.
+    _pyspark_model_cls_ = None
+
     def __init__(self):
         super().__init__()
         self._set_xgb_params_default()
@@ -580,10 +754,11 @@ class _SparkXGBEstimator(Estimator, _SparkXGBParams, MLReadable, MLWritable):
     @classmethod
     def _pyspark_model_cls(cls):
         """
-        Subclasses should override this method and
-        returns a _SparkXGBModel subclass
+        Returns the _SparkXGBModel subclass set by subclasses in `_pyspark_model_cls_`
         """
-        raise NotImplementedError()
+        if cls._pyspark_model_cls_ is None:
+            raise NotImplementedError()
+        return cls._pyspark_model_cls_
 
     def _create_pyspark_model(self, xgb_model):
         return self._pyspark_model_cls()(xgb_model)
@@ -592,7 +767,7 @@ class _SparkXGBEstimator(Estimator, _SparkXGBParams, MLReadable, MLWritable):
         xgb_sklearn_params = self._gen_xgb_params_dict(
             gen_xgb_sklearn_estimator_param=True
         )
-        sklearn_model = self._xgb_cls()(**xgb_sklearn_params)
+        sklearn_model = type(self)._xgb_cls_(**xgb_sklearn_params)
         sklearn_model.load_model(booster)
         sklearn_model._Booster.load_config(config)
         return sklearn_model
@@ -651,7 +826,7 @@ class _SparkXGBEstimator(Estimator, _SparkXGBParams, MLReadable, MLWritable):
 
         params.update(fit_params)
         params["verbose_eval"] = verbose_eval
-        classification = self._xgb_cls() == XGBClassifier
+        classification = type(self)._xgb_cls_ == XGBClassifier
         if classification:
             num_classes = int(
                 dataset.select(countDistinct(alias.label)).collect()[0][0]
@@ -966,10 +1141,6 @@ class _SparkXGBModel(Model, _SparkXGBParams, MLReadable, MLWritable):
         super().__init__()
         self._xgb_sklearn_model = xgb_sklearn_model
 
-    @classmethod
-    def _xgb_cls(cls):
-        raise NotImplementedError()
-
     def get_booster(self):
         """
         Return the `xgboost.core.Booster` instance.
@@ -1438,7 +1609,7 @@ class SparkXGBModelReader(MLReader):
         )
 
         def create_xgb_model():
-            return self.cls._xgb_cls()(**xgb_sklearn_params)
+            return self.cls._xgb_cls_(**xgb_sklearn_params)
 
         xgb_model = deserialize_xgb_model(ser_xgb_model, create_xgb_model)
         py_model._xgb_sklearn_model = xgb_model
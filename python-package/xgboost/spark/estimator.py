@@ -4,74 +4,19 @@
 
 from typing import Any, Type
 
-import numpy as np
-from pyspark.ml.param import Param, Params
 from pyspark.ml.param.shared import HasProbabilityCol, HasRawPredictionCol
 
-from xgboost import XGBClassifier, XGBRanker, XGBRegressor
+from xgboost import XGBClassifier, XGBModel, XGBRanker, XGBRegressor
 
 from .core import (  # type: ignore
     _ClassificationModel,
     _SparkXGBEstimator,
     _SparkXGBModel,
 )
-from .utils import get_class_name
 
-
-def _set_pyspark_xgb_cls_param_attrs(
-    estimator: _SparkXGBEstimator, model: _SparkXGBModel
-) -> None:
-    """This function automatically infer to xgboost parameters and set them
-    into corresponding pyspark estimators and models"""
-    params_dict = estimator._get_xgb_params_default()
-
-    def param_value_converter(v: Any) -> Any:
-        if isinstance(v, np.generic):
-            # convert numpy scalar values to corresponding python scalar values
-            return np.array(v).item()
-        if isinstance(v, dict):
-            return {k: param_value_converter(nv) for k, nv in v.items()}
-        if isinstance(v, list):
-            return [param_value_converter(nv) for nv in v]
-        return v
-
-    def set_param_attrs(attr_name: str, param: Param) -> None:
-        param.typeConverter = param_value_converter
-        setattr(estimator, attr_name, param)
-        setattr(model, attr_name, param)
-
-    for name in params_dict.keys():
-        doc = (
-            f"Refer to XGBoost doc of "
-            f"{get_class_name(estimator._xgb_cls())} for this param {name}"
-        )
-
-        param_obj: Param = Param(Params._dummy(), name=name, doc=doc)
-        set_param_attrs(name, param_obj)
-
-    fit_params_dict = estimator._get_fit_params_default()
-    for name in fit_params_dict.keys():
-        doc = (
-            f"Refer to XGBoost doc of {get_class_name(estimator._xgb_cls())}"
-            f".fit() for this param {name}"
-        )
-        if name == "callbacks":
-            doc += (
-                "The callbacks can be arbitrary functions. It is saved using cloudpickle "
-                "which is not a fully self-contained format. It may fail to load with "
-                "different versions of dependencies."
-            )
-        param_obj = Param(Params._dummy(), name=name, doc=doc)
-        set_param_attrs(name, param_obj)
-
-    predict_params_dict = estimator._get_predict_params_default()
-    for name in predict_params_dict.keys():
-        doc = (
-            f"Refer to XGBoost doc of {get_class_name(estimator._xgb_cls())}"
-            f".predict() for this param {name}"
-        )
-        param_obj = Param(Params._dummy(), name=name, doc=doc)
-        set_param_attrs(name, param_obj)
+_CUSTOM_OBJECTIVE_ERROR_MSG = (
+    "Setting custom 'objective' param is not allowed in 'SparkXGBClassifier'."
+)
 
 
 class SparkXGBRegressor(_SparkXGBEstimator):
@@ -155,21 +100,17 @@ class SparkXGBRegressor(_SparkXGBEstimator):
 
     """
 
+    # Declarative only: pyspark `Params` bases keep a per-instance `__dict__`.
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__()
         self.setParams(**kwargs)
 
-    @classmethod
-    def _xgb_cls(cls) -> Type[XGBRegressor]:
-        return XGBRegressor
-
-    @classmethod
-    def _pyspark_model_cls(cls) -> Type["SparkXGBRegressorModel"]:
-        return SparkXGBRegressorModel
-
     def _validate_params(self) -> None:
         super()._validate_params()
-        if self.isDefined(self.qid_col):
+        qid_col = self.qid_col
+        if qid_col in self._paramMap or qid_col in self._defaultParamMap:
             raise ValueError(
                 "Spark Xgboost regressor estimator does not support `qid_col` param."
             )
@@ -182,12 +123,7 @@ class SparkXGBRegressorModel(_SparkXGBModel):
     .. Note:: This API is experimental.
     """
 
-    @classmethod
-    def _xgb_cls(cls) -> Type[XGBRegressor]:
-        return XGBRegressor
-
-
-_set_pyspark_xgb_cls_param_attrs(SparkXGBRegressor, SparkXGBRegressorModel)
+    __slots__ = ()
 
 
 class SparkXGBClassifier(_SparkXGBEstimator, HasProbabilityCol, HasRawPredictionCol):
@@ -281,7 +217,11 @@ class SparkXGBClassifier(_SparkXGBEstimator, HasProbabilityCol, HasRawPrediction
 
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
+        if kwargs.get("objective"):
+            raise ValueError(_CUSTOM_OBJECTIVE_ERROR_MSG)
         super().__init__()
         # The default 'objective' param value comes from sklearn `XGBClassifier` ctor,
         # but in pyspark we will automatically set objective param depending on
@@ -290,24 +230,16 @@ class SparkXGBClassifier(_SparkXGBEstimator, HasProbabilityCol, HasRawPrediction
         self._setDefault(objective=None)
         self.setParams(**kwargs)
 
-    @classmethod
-    def _xgb_cls(cls) -> Type[XGBClassifier]:
-        return XGBClassifier
-
-    @classmethod
-    def _pyspark_model_cls(cls) -> Type["SparkXGBClassifierModel"]:
-        return SparkXGBClassifierModel
-
     def _validate_params(self) -> None:
         super()._validate_params()
-        if self.isDefined(self.qid_col):
+        qid_col = self.qid_col
+        if qid_col in self._paramMap or qid_col in self._defaultParamMap:
             raise ValueError(
                 "Spark Xgboost classifier estimator does not support `qid_col` param."
             )
-        if self.getOrDefault(self.objective):  # pylint: disable=no-member
-            raise ValueError(
-                "Setting custom 'objective' param is not allowed in 'SparkXGBClassifier'."
-            )
+        objective = self.objective
+        if self._paramMap.get(objective, self._defaultParamMap.get(objective)):
+            raise ValueError(_CUSTOM_OBJECTIVE_ERROR_MSG)
 
 
 class SparkXGBClassifierModel(_ClassificationModel):
@@ -317,12 +249,7 @@ class SparkXGBClassifierModel(_ClassificationModel):
     .. Note:: This API is experimental.
     """
 
-    @classmethod
-    def _xgb_cls(cls) -> Type[XGBClassifier]:
-        return XGBClassifier
-
-
-_set_pyspark_xgb_cls_param_attrs(SparkXGBClassifier, SparkXGBClassifierModel)
+    __slots__ = ()
 
 
 class SparkXGBRanker(_SparkXGBEstimator):
@@ -426,21 +353,16 @@ class SparkXGBRanker(_SparkXGBEstimator):
     >>> model.transform(df_test).show()
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__()
         self.setParams(**kwargs)
 
-    @classmethod
-    def _xgb_cls(cls) -> Type[XGBRanker]:
-        return XGBRanker
-
-    @classmethod
-    def _pyspark_model_cls(cls) -> Type["SparkXGBRankerModel"]:
-        return SparkXGBRankerModel
-
     def _validate_params(self) -> None:
         super()._validate_params()
-        if not self.isDefined(self.qid_col):
+        qid_col = self.qid_col
+        if qid_col not in self._paramMap and qid_col not in self._defaultParamMap:
             raise ValueError(
                 "Spark Xgboost ranker estimator requires setting `qid_col` param."
             )
@@ -453,9 +375,20 @@ class SparkXGBRankerModel(_SparkXGBModel):
     .. Note:: This API is experimental.
     """
 
-    @classmethod
-    def _xgb_cls(cls) -> Type[XGBRanker]:
-        return XGBRanker
+    __slots__ = ()
+
+
+def _bind_xgb_classes(
+    xgb_cls: Type[XGBModel],
+    estimator: Type[_SparkXGBEstimator],
+    model: Type[_SparkXGBModel],
+) -> None:
+    """Bind a pyspark estimator and its model to their xgboost sklearn class."""
+    estimator._xgb_cls_ = xgb_cls
+    estimator._pyspark_model_cls_ = model
+    model._xgb_cls_ = xgb_cls
 
 
-_set_pyspark_xgb_cls_param_attrs(SparkXGBRanker, SparkXGBRankerModel)
+_bind_xgb_classes(XGBRegressor, SparkXGBRegressor, SparkXGBRegressorModel)
+_bind_xgb_classes(XGBClassifier, SparkXGBClassifier, SparkXGBClassifierModel)
+_bind_xgb_classes(XGBRanker, SparkXGBRanker, SparkXGBRankerModel)
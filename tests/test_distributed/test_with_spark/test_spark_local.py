@@ -1,6 +1,8 @@
 import glob
 import logging
 import random
+import subprocess
+import sys
 import tempfile
 import uuid
 from collections import namedtuple
@@ -20,6 +22,7 @@ from pyspark.ml.evaluation import BinaryClassificationEvaluator
 from pyspark.ml.feature import VectorAssembler
 from pyspark.ml.functions import vector_to_array
 from pyspark.ml.linalg import Vectors
+from pyspark.ml.param import Param
 from pyspark.ml.tuning import CrossValidator, ParamGridBuilder
 from pyspark.sql import SparkSession
 from pyspark.sql import functions as spark_sql_func
@@ -32,7 +35,13 @@ from xgboost.spark import (
     SparkXGBRegressor,
     SparkXGBRegressorModel,
 )
-from xgboost.spark.core import _non_booster_params
+from xgboost.spark.core import (
+    _fit_params_default,
+    _non_booster_params,
+    _predict_params_default,
+    _spark_param_value_converter,
+    _xgb_params_default,
+)
 
 from .utils import SparkTestCase
 
@@ -1040,6 +1049,8 @@ class XgboostLocalTest(SparkTestCase):
         self.assertFalse(hasattr(py_cls, "gpu_id"))
         self.assertEqual(py_cls.getOrDefault(py_cls.n_estimators), 100)
         self.assertEqual(py_cls.getOrDefault(py_cls.objective), None)
+        with pytest.raises(ValueError, match="Setting custom 'objective' param"):
+            SparkXGBClassifier(objective="binary:logistic")
         py_cls2 = SparkXGBClassifier(n_estimators=200)
         self.assertEqual(py_cls2.getOrDefault(py_cls2.n_estimators), 200)
         py_cls3 = py_cls2.copy({py_cls2.max_depth: 10})
@@ -1087,6 +1098,71 @@ class XgboostLocalTest(SparkTestCase):
             == "float64"
         )
 
+    @staticmethod
+    def test_param_value_converter_nested():
+        converted = _spark_param_value_converter(
+            {"a": [np.float64(0.5), {"b": np.int32(2)}], "c": "x", "d": []}
+        )
+        assert converted == {"a": [0.5, {"b": 2}], "c": "x", "d": []}
+        assert converted["a"][0].__class__.__name__ == "float"
+        assert converted["a"][1]["b"].__class__.__name__ == "int"
+
+    @staticmethod
+    def test_param_value_converter_cyclic():
+        cyclic_dict = {"a": np.float64(0.5)}
+        cyclic_dict["self"] = cyclic_dict
+        converted = _spark_param_value_converter(cyclic_dict)
+        assert converted is not cyclic_dict
+        assert converted["a"].__class__.__name__ == "float"
+        assert converted["self"] is converted
+
+        cyclic_list = [np.int32(1)]
+        cyclic_list.append(cyclic_list)
+        converted = _spark_param_value_converter(cyclic_list)
+        assert converted[0].__class__.__name__ == "int"
+        assert converted[1] is converted
+
+    @staticmethod
+    def test_lazy_xgb_param_attrs():
+        # Resolved on the class before any instance is created.
+        assert isinstance(SparkXGBRegressor.max_depth, Param)
+        assert SparkXGBRegressor.max_depth.name == "max_depth"
+        assert not hasattr(SparkXGBRegressor, "no_such_param")
+        # The estimator and its model share the `Param` objects.
+        assert SparkXGBRegressor.max_depth is SparkXGBRegressorModel.max_depth
+        assert SparkXGBRegressor.verbose is SparkXGBRegressorModel.verbose
+
+        xgb_param_names = (
+            _xgb_params_default(XGBRegressor).keys()
+            | _fit_params_default(XGBRegressor).keys()
+            | _predict_params_default(XGBRegressor).keys()
+        )
+        py_reg = SparkXGBRegressor()
+        assert xgb_param_names <= {param.name for param in py_reg.params}
+        assert py_reg.max_depth.parent == py_reg.uid
+
+    @staticmethod
+    def test_xgb_param_attrs_not_installed_on_import():
+        code = (
+            "import xgboost.spark as spark\n"
+            "for name in spark.__all__:\n"
+            "    assert not getattr(spark, name)._params_installed, name\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @staticmethod
+    def test_xgb_param_attrs_subclass():
+        class CustomSparkXGBClassifier(SparkXGBClassifier):
+            pass
+
+        py_cls = CustomSparkXGBClassifier(max_depth=3)
+        assert CustomSparkXGBClassifier._params_installed
+        assert py_cls.max_depth.parent == py_cls.uid
+        assert py_cls.getOrDefault(py_cls.max_depth) == 3
+        assert py_cls.getOrDefault(py_cls.n_estimators) == 100
+        assert py_cls.getOrDefault(py_cls.objective) is None
+        assert "max_depth" in {param.name for param in py_cls.params}
+
     def test_callbacks(self):
         from xgboost.callback import LearningRateScheduler
 